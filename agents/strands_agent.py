@@ -1,7 +1,12 @@
-import queue
+import ast
+import concurrent.futures
+import functools
+import operator
+import re
 import threading
-import time
-from typing import Any, Dict, Generator
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Generator, List, Optional
 
 from strands import Agent
 from strands.models import BedrockModel
@@ -16,13 +21,88 @@ from handlers.lifecycle_handlers import (
 )
 from handlers.ui_handlers import StreamlitUIHandler, StreamlitUIState
 
+# Upper bound on events yielded per wakeup so the UI keeps repainting
+MAX_EVENT_BATCH = 32
+
+# Seconds without any event before the stream is considered unresponsive
+STREAM_IDLE_TIMEOUT = 60.0
+
+
+@dataclass(slots=True)
+class StreamEvent:
+    """Callback payload plus the terminal flags resolved by the producer."""
+
+    kwargs: Dict[str, Any]
+    result: Any = None
+    force_stop: bool = False
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> "StreamEvent":
+        return cls(kwargs, kwargs.get("result"), bool(kwargs.get("force_stop")))
+
+
+# Arithmetic operators the calculator tool accepts
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_MAX_EXPONENT = 1000
+# Largest integer power the calculator computes, in bits (~3000 digits)
+_MAX_POWER_BITS = 10_000
+
+# Characters an arithmetic expression may contain, including exponent forms
+# (1e3) and digit separators (1_000); a cheap pre-filter, _evaluate does
+# the real validation
+_SAFE_EXPR = re.compile(r"[\d+\-*/().%\seE_]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an expression once; repeated calculations reuse the tree."""
+    return ast.parse(expression.strip(), mode="eval").body
+
+
+def _evaluate(node: ast.expr) -> float:
+    """Evaluate a parsed arithmetic expression, rejecting anything else."""
+    node_type = type(node)
+    if node_type is ast.Constant and type(node.value) in (int, float):
+        return node.value
+    if node_type is ast.BinOp and type(node.op) in _BINARY_OPS:
+        left = _evaluate(node.left)
+        right = _evaluate(node.right)
+        if type(node.op) is ast.Pow:
+            if abs(right) > _MAX_EXPONENT:
+                raise ValueError("Exponent too large")
+            # Bound the result before computing it: nested powers keep each
+            # exponent small while the base grows without limit
+            if (
+                type(left) is int
+                and type(right) is int
+                and abs(left).bit_length() * right > _MAX_POWER_BITS
+            ):
+                raise ValueError("Result too large")
+        return _BINARY_OPS[type(node.op)](left, right)
+    if node_type is ast.UnaryOp and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    raise ValueError("Invalid expression")
+
+
 @tool
 def calculator(expression: str) -> str:
     """Perform basic arithmetic calculations"""
     try:
-        if any(char in expression for char in ['import', 'exec', 'eval', '__']):
+        if not _SAFE_EXPR.fullmatch(expression):
             return "Error: Invalid expression"
-        return str(eval(expression))
+        return str(_evaluate(_parse_expression(expression)))
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -32,8 +112,22 @@ def weather(location: str) -> str:
     return f"Weather in {location}: Sunny, 22°C (Mock data)"
 
 class StrandsAgent:
-    def __init__(self, region: str = "us-west-2", model_id: str = "openai.gpt-oss-20b-1:0"):
-        self.event_queue = queue.Queue()
+    def __init__(
+        self,
+        region: str = "us-west-2",
+        model_id: str = "openai.gpt-oss-20b-1:0",
+        model: Optional[BedrockModel] = None,
+    ):
+        # Single-producer (agent thread) / single-consumer (Streamlit thread)
+        # handoff: deque append/popleft are atomic, the event signals arrivals
+        self.event_queue = deque()
+        self._event_ready = threading.Event()
+        self._done = threading.Event()
+
+        # One long-lived worker runs agent calls so each prompt reuses it
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="strands-agent"
+        )
         self.event_registry = EventRegistry()
         self.ui_state = StreamlitUIState()
 
@@ -43,8 +137,9 @@ class StrandsAgent:
         # Create model - disable thinking for now due to tool use constraints
         # Anthropic requires thinking blocks in conversation history after tool use
         # Current Strands version (1.9.1) doesn't handle this automatically
+        # A prebuilt model (e.g. one shared across sessions) takes precedence
         self.agent = Agent(
-            model=model_id,
+            model=model or model_id,
             tools=[calculator, weather],
             callback_handler=self._callback_handler
         )
@@ -56,97 +151,106 @@ class StrandsAgent:
         self.event_registry.register(ReasoningHandler())
         self.event_registry.register(LoggingHandler(log_level="INFO"))
         self.event_registry.register(DebugHandler(debug_enabled=False))
+        self.event_registry.freeze()
     
     def enable_debug_mode(self, enabled: bool = True):
         """Toggle the debug handler."""
-        for handler in self.event_registry._handlers:
-            if isinstance(handler, DebugHandler):
-                handler.debug_enabled = enabled
-                break
+        debug_handler = self.event_registry.get_handler(DebugHandler)
+        if debug_handler:
+            debug_handler.debug_enabled = enabled
+            self.event_registry.invalidate_routes()
     
-    def _classify_event(self, event_data: Dict[str, Any]) -> list:
-        """Return the raw event; placeholder for future routing."""
-        return [event_data]
+    def _coalesce(self, batch: List[StreamEvent]) -> List[StreamEvent]:
+        """Keep only the latest event per coalescing key within a batch."""
+        if len(batch) < 2:
+            return batch
+        keyed = {}
+        for index, event in enumerate(batch):
+            key = self.event_registry.classify(event.kwargs)
+            # Re-assigning a key keeps its first position but the newest event
+            keyed[index if key is None else key] = event
+        return list(keyed.values())
 
     def _callback_handler(self, **kwargs):
         """Handle streaming events from Strands Agent"""
         # Only enqueue events; processing happens on the main thread
-        self.event_queue.put(kwargs)
+        self._enqueue(StreamEvent.from_kwargs(kwargs))
+
+    def _enqueue(self, event: StreamEvent) -> None:
+        """Hand an event to the consumer and wake it up."""
+        self.event_queue.append(event)
+        self._event_ready.set()
 
     def drain_events(self):
         """Clear remaining events after streaming ends."""
-        drained_count = 0
-        while not self.event_queue.empty():
-            try:
-                self.event_queue.get_nowait()
-                drained_count += 1
-            except queue.Empty:
-                break
+        self.event_queue.clear()
+        self._event_ready.clear()
 
-    def stream_response(self, user_input: str) -> Generator[Dict[str, Any], None, None]:
-        """Stream response using Strands Agent with handler system"""
+    def stream_response(self, user_input: str) -> Generator[List[StreamEvent], None, None]:
+        """Stream batches of events using Strands Agent with handler system"""
         
         # Clear any stale events before starting a new stream
-        while not self.event_queue.empty():
-            try:
-                self.event_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.drain_events()
+        self._done.clear()
 
-        # UI state is already reset by app.py before calling stream_response
-        # Don't reset again here to preserve placeholder settings
-        # self.ui_state.reset()  # Commented out to preserve placeholders
+        # Callers own ui_state.reset(): they must reset before binding
+        # placeholders, so resetting here would discard them
 
-        # But we do need to reset the COT manager's internal state
-        ui_handler = None
-        for handler in self.event_registry._handlers:
-            if hasattr(handler, 'reset_for_new_conversation'):
-                handler.reset_for_new_conversation()
-                break
+        # Only the COT manager's internal parsing state is reset here
+        ui_handler = self.event_registry.get_handler(StreamlitUIHandler)
+        if ui_handler:
+            ui_handler.reset_for_new_conversation()
 
         def run_agent():
             try:
                 result = self.agent(user_input)
-                self.event_queue.put({"result": result})
+                self._enqueue(StreamEvent.from_kwargs({"result": result}))
             except Exception as e:
-                self.event_queue.put({"force_stop": True, "force_stop_reason": str(e)})
-        
-        # Run the agent call in a background thread
-        thread = threading.Thread(target=run_agent)
-        thread.start()
+                self._enqueue(StreamEvent.from_kwargs(
+                    {"force_stop": True, "force_stop_reason": str(e)}
+                ))
+            finally:
+                # Wake the consumer even if nothing else was enqueued
+                self._done.set()
+                self._event_ready.set()
 
-        try:
-            # Yield events as they arrive from the queue
-            start_time = time.time()
+        # Run the agent call on the background worker
+        future = self._executor.submit(run_agent)
 
+        try:
+            # Yield batches of events as they arrive from the queue
             while True:
-                try:
-                    event = self.event_queue.get(timeout=1.0)
-                    
-                    # Preserve the legacy event structure for downstream consumers
-                    yield event
-
-                    # Stop once the agent reports completion or a forced stop
-                    if event.get("result") or event.get("force_stop"):
-                        break
+                if not self._event_ready.wait(timeout=STREAM_IDLE_TIMEOUT):
+                    # Abort if the agent is unresponsive for too long
+                    timeout_event = StreamEvent.from_kwargs(
+                        {"force_stop": True, "force_stop_reason": "Timeout"}
+                    )
+                    yield [timeout_event]
+                    break
 
-                except queue.Empty:
-                    elapsed = time.time() - start_time
+                # Clear before draining so an append racing with the drain
+                # leaves the event set for the next wait
+                self._event_ready.clear()
+                while self.event_queue:
+                    batch = []
+                    while self.event_queue and len(batch) < MAX_EVENT_BATCH:
+                        # The legacy event dict travels untouched in event.kwargs
+                        event = self.event_queue.popleft()
+                        batch.append(event)
 
-                    if not thread.is_alive():
-                        break
+                        # Stop once the agent reports completion or a forced stop
+                        if event.result is not None or event.force_stop:
+                            yield self._coalesce(batch)
+                            return
 
-                    # Abort if the agent is unresponsive for too long
-                    if elapsed > 60:
-                        timeout_event = {"force_stop": True, "force_stop_reason": "Timeout"}
-                        yield timeout_event
-                        break
+                    yield self._coalesce(batch)
 
-                    continue
+                if self._done.is_set() and not self.event_queue:
+                    break
 
         finally:
-            # Ensure the background thread and queue are cleaned up
-            thread.join()
+            # Ensure the background call and queue are cleaned up
+            future.result()
             self.drain_events()
 
     def get_ui_state(self) -> StreamlitUIState:
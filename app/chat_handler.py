@@ -3,6 +3,8 @@
 from typing import Dict, Any
 import streamlit as st
 
+from handlers.ui_handlers import StreamlitUIHandler
+
 from .session_manager import SessionManager
 from .utils.placeholder_manager import PlaceholderManager
 from .utils.error_handler import ErrorHandler
@@ -31,11 +33,14 @@ class ChatHandler:
 
     def _handle_assistant_response(self, prompt: str) -> None:
         """Handle the assistant response generation and streaming."""
-        # Create placeholders
+        # Create placeholders inside a single container, in display order.
+        # All four are created up front: a placeholder added later would
+        # render below the response text.
         message_container = st.container()
-        status_ph, tool_ph, chain_ph, response_ph = (
-            self.placeholder_manager.create_chat_placeholders(message_container)
-        )
+        status_ph = message_container.empty()
+        tool_ph = message_container.empty()
+        chain_ph = message_container.empty()
+        response_ph = message_container.empty()
 
         # Setup UI state
         agent = self.session_manager.agent
@@ -61,12 +66,17 @@ class ChatHandler:
 
     def _stream_response(self, prompt: str, agent, status_ph, chain_ph, response_ph) -> None:
         """Stream the agent response and handle events."""
-        # Stream events and process them
+        ui_handler = agent.event_registry.get_handler(StreamlitUIHandler)
+
+        # Stream event batches and process them
         stream = agent.stream_response(prompt)
-        for event in stream:
+        for batch in stream:
+            # A terminal event (result or force stop) always closes its batch
             try:
-                # Process events on the main thread
-                results = agent.event_registry.process_event(event)
+                # Process the whole batch on the main thread in one pass
+                results = agent.event_registry.process_events(
+                    event.kwargs for event in batch
+                )
 
                 # Handle any handler errors
                 self.error_handler.handle_handler_errors(results, status_ph)
@@ -75,17 +85,17 @@ class ChatHandler:
                 # Display handler error but continue streaming
                 self.error_handler.display_handler_error(handler_error, status_ph)
 
-            # Stop streaming once the agent reports completion
-            if event.get("result") or event.get("force_stop"):
-                break
+            # Once the queue is idle (e.g. during a tool call) nothing will
+            # trigger another render soon, so show the held-back text now
+            if ui_handler:
+                ui_handler.flush_response(force=not agent.event_queue)
 
-        # Finalize and persist the response
+        # Finalize and persist the response (renders the complete text)
         self._finalize_response(agent)
 
     def _finalize_response(self, agent) -> None:
         """Finalize the assistant response and add to session."""
-        for handler in agent.event_registry._handlers:
-            if hasattr(handler, "finalize_response"):
-                assistant_message = handler.finalize_response()
-                self.session_manager.add_message("assistant", assistant_message)
-                break
\ No newline at end of file
+        ui_handler = agent.event_registry.get_handler(StreamlitUIHandler)
+        if ui_handler:
+            assistant_message = ui_handler.finalize_response()
+            self.session_manager.add_message("assistant", assistant_message)
\ No newline at end of file
@@ -1,9 +1,9 @@
 """Application configuration settings."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Any, Dict, Tuple
 
-from .env_loader import EnvLoader
+from .env_loader import get_env_loader
 
 
 @dataclass
@@ -14,7 +14,7 @@ class AppConfig:
     page_config: Dict[str, Any] = None
 
     # Available models
-    available_models: List[str] = None
+    available_models: Tuple[str, ...] = None
 
     # Default model
     default_model: str = "us.amazon.nova-pro-v1:0"
@@ -26,7 +26,7 @@ class AppConfig:
 
     def __post_init__(self):
         # Load environment variables
-        env = EnvLoader()
+        env = get_env_loader()
 
         if self.page_config is None:
             self.page_config = {
@@ -36,21 +36,23 @@ class AppConfig:
             }
 
         if self.available_models is None:
-            self.available_models = [
+            self.available_models = (
                 "us.amazon.nova-pro-v1:0",
                 "us.anthropic.claude-sonnet-4-20250514-v1:0",
                 "openai.gpt-oss-120b-1:0",
                 "openai.gpt-oss-20b-1:0",
-            ]
+            )
+        else:
+            self.available_models = tuple(self.available_models)
+
+        # Position of each model, used for the sidebar default selection
+        self._model_index = {model: i for i, model in enumerate(self.available_models)}
 
         # Override default model from environment if specified
         env_default_model = env.get('DEFAULT_MODEL')
-        if env_default_model and env_default_model in self.available_models:
+        if env_default_model and env_default_model in self._model_index:
             self.default_model = env_default_model
 
     def get_default_model_index(self) -> int:
         """Get the index of the default model in the available models list."""
-        try:
-            return self.available_models.index(self.default_model)
-        except ValueError:
-            return 0
\ No newline at end of file
+        return self._model_index.get(self.default_model, 0)
\ No newline at end of file
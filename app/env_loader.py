@@ -1,5 +1,6 @@
 """Environment variable loader with .env file support."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -20,24 +21,25 @@ class EnvLoader:
             return
 
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        self.env_vars[key] = value
+            lines = env_file.read_text().splitlines()
         except Exception as e:
             print(f"Warning: Could not read .env file: {e}")
+            return
+
+        parsed = {}
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if '=' in line:
+                key, value = line.split('=', 1)
+                parsed[key.strip()] = value.strip().strip('"').strip("'")
+        self.env_vars.update(parsed)
 
     def _load_system_env(self) -> None:
         """Load system environment variables (they override .env file)."""
-        for key, value in os.environ.items():
-            self.env_vars[key] = value
+        self.env_vars.update(os.environ)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get environment variable value."""
@@ -63,4 +65,10 @@ class EnvLoader:
         return {
             'debug_logging': self.get_bool('DEBUG_LOGGING', False),
             'log_level': self.get('LOG_LEVEL', 'INFO'),
-        }
\ No newline at end of file
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def get_env_loader() -> EnvLoader:
+    """Return the process-wide loader; .env is parsed once per process."""
+    return EnvLoader()
@@ -29,7 +29,9 @@ class StreamlitChatApp:
         self.ui_manager.render_header(current_model)
 
         # Render chat history
-        self.ui_manager.render_chat_history(self.session_manager.messages)
+        self.ui_manager.render_chat_history(
+            self.session_manager.messages, self.session_manager.parsed_messages
+        )
 
         # Handle new user input
         if prompt := self.ui_manager.get_user_input():
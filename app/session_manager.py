@@ -3,9 +3,22 @@
 from typing import List, Dict, Any, Optional
 import streamlit as st
 
+from strands.models import BedrockModel
+
 from agents.strands_agent import StrandsAgent
 
 
+@st.cache_resource
+def _get_model(model_id: str) -> BedrockModel:
+    """Share one Bedrock model client per model id across sessions."""
+    return BedrockModel(model_id=model_id)
+
+
+def _create_agent(model_id: str) -> StrandsAgent:
+    """Create a per-session agent on top of the shared model client."""
+    return StrandsAgent(model_id=model_id, model=_get_model(model_id))
+
+
 class SessionManager:
     """Manage Streamlit session state for the chat application."""
 
@@ -17,6 +30,9 @@ class SessionManager:
         if "messages" not in st.session_state:
             st.session_state.messages = []
 
+        if "parsed_messages" not in st.session_state:
+            st.session_state.parsed_messages = []
+
         if "agent" not in st.session_state:
             st.session_state.agent = None
 
@@ -28,6 +44,11 @@ class SessionManager:
         """Get the chat messages from session state."""
         return st.session_state.messages
 
+    @property
+    def parsed_messages(self) -> List[Optional[Dict[str, Any]]]:
+        """Get the render-ready form of each message, filled in lazily."""
+        return st.session_state.parsed_messages
+
     @property
     def agent(self) -> Optional[StrandsAgent]:
         """Get the current agent from session state."""
@@ -47,14 +68,15 @@ class SessionManager:
         # First time initialization
         if st.session_state.current_model is None:
             st.session_state.current_model = selected_model
-            st.session_state.agent = StrandsAgent(model_id=selected_model)
+            st.session_state.agent = _create_agent(selected_model)
             return True
 
         # Model changed - reset session
         if st.session_state.current_model != selected_model:
             st.session_state.current_model = selected_model
-            st.session_state.agent = StrandsAgent(model_id=selected_model)
+            st.session_state.agent = _create_agent(selected_model)
             st.session_state.messages = []
+            st.session_state.parsed_messages = []
             st.rerun()
             return True
 
@@ -68,4 +90,5 @@ class SessionManager:
 
     def clear_messages(self) -> None:
         """Clear all chat messages."""
-        st.session_state.messages = []
\ No newline at end of file
+        st.session_state.messages = []
+        st.session_state.parsed_messages = []
\ No newline at end of file
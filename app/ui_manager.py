@@ -1,6 +1,6 @@
 """UI component management for Streamlit."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import streamlit as st
 
 from .config import AppConfig
@@ -36,14 +36,31 @@ class UIManager:
         st.title(self.config.app_title)
         st.caption(f"Current model: {current_model}")
 
-    def render_chat_history(self, messages: List[Dict[str, Any]]) -> None:
-        """Render the chat history."""
-        for message in messages:
+    def render_chat_history(
+        self,
+        messages: List[Dict[str, Any]],
+        parsed_cache: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Render the chat history, parsing only messages not seen before."""
+        if parsed_cache is None:
+            parsed_cache = []
+        elif len(parsed_cache) > len(messages):
+            parsed_cache.clear()
+
+        for index, message in enumerate(messages):
+            if index == len(parsed_cache):
+                parsed_cache.append(
+                    None if message["role"] == "user"
+                    else self.message_renderer.parse_assistant_message(message["content"])
+                )
+
             with st.chat_message(message["role"]):
                 if message["role"] == "user":
                     st.markdown(message["content"])
                 else:
-                    self.message_renderer.render_assistant_message(message["content"])
+                    self.message_renderer.render_assistant_message(
+                        message["content"], parsed_cache[index]
+                    )
 
     def get_user_input(self) -> str:
         """Get user input from chat input widget."""
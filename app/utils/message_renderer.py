@@ -1,6 +1,6 @@
 """Message rendering utilities for Streamlit."""
 
-from typing import Any
+from typing import Any, Dict, Optional
 import streamlit as st
 
 from handlers.ui_handlers import (
@@ -14,28 +14,38 @@ class MessageRenderer:
     """Handle rendering of assistant messages in Streamlit."""
 
     @staticmethod
-    def render_assistant_message(content: Any) -> None:
+    def parse_assistant_message(content: Any) -> Dict[str, Any]:
+        """Normalize stored assistant content into its renderable parts."""
+        # Common case: the structured dict produced by finalize_response
+        if type(content) is dict:
+            return {
+                "text": content.get("text", ""),
+                "chain_of_thought": content.get("chain_of_thought"),
+                "tool_calls": content.get("tool_calls") or [],
+            }
+
+        # Fallback for string content; only run the regex when tags are present
+        text = str(content)
+        if "<thinking>" not in text:
+            return {"text": text.strip(), "chain_of_thought": None, "tool_calls": []}
+        text, chain_of_thought = parse_model_response(text)
+        return {"text": text, "chain_of_thought": chain_of_thought, "tool_calls": []}
+
+    @staticmethod
+    def render_assistant_message(content: Any, parsed: Optional[Dict[str, Any]] = None) -> None:
         """Render the assistant message using the helper utilities."""
-        if isinstance(content, dict) and "text" in content:
-            text = content.get("text", "")
-            tool_calls = content.get("tool_calls") or []
-            chain_of_thought = content.get("chain_of_thought")
-
-            if tool_calls:
-                render_tool_calls(tool_calls)
-            if chain_of_thought:
-                render_chain_of_thought(chain_of_thought)
-            if text:
-                st.markdown(text)
-            elif not tool_calls and not chain_of_thought:
-                st.markdown("*Response is empty.*")
-            return
-
-        # Fallback for string content
-        text, chain_of_thought = parse_model_response(str(content))
+        if parsed is None:
+            parsed = MessageRenderer.parse_assistant_message(content)
+
+        text = parsed["text"]
+        tool_calls = parsed["tool_calls"]
+        chain_of_thought = parsed["chain_of_thought"]
+
+        if tool_calls:
+            render_tool_calls(tool_calls)
         if chain_of_thought:
             render_chain_of_thought(chain_of_thought)
         if text:
             st.markdown(text)
-        elif not chain_of_thought:
+        elif not tool_calls and not chain_of_thought:
             st.markdown("*Response is empty.*")
\ No newline at end of file
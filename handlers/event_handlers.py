@@ -1,7 +1,8 @@
 """Event handler architecture for streaming callbacks."""
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
 
 class EventType(Enum):
@@ -37,7 +38,11 @@ class EventHandler(ABC):
     
     @abstractmethod
     def can_handle(self, event_type: str) -> bool:
-        """Return True if the handler can process the event type."""
+        """Return True if the handler can process the event type.
+
+        The registry caches the answer per event type; call
+        ``EventRegistry.invalidate_routes`` if it changes at runtime.
+        """
         pass
     
     @abstractmethod
@@ -45,10 +50,23 @@ class EventHandler(ABC):
         """Handle an event and optionally return structured data."""
         pass
     
-    @property
-    def priority(self) -> int:
-        """Handler priority (lower is executed earlier)."""
-        return 100
+    # Handler priority (lower is executed earlier)
+    priority: ClassVar[int] = 100
+
+
+HandlerT = TypeVar("HandlerT", bound=EventHandler)
+
+# Keys that identify an event's type, checked in order
+_PRIORITY_EVENTS = (
+    "data",
+    "current_tool_use",
+    "tool_result",
+    "reasoning",
+    "reasoningText",
+    "redactedContent",
+    "result",
+    "force_stop",
+)
 
 
 class EventRegistry:
@@ -56,24 +74,89 @@ class EventRegistry:
     
     def __init__(self):
         self._handlers: List[EventHandler] = []
+        self._by_class: Dict[type, EventHandler] = {}
+        # (handler, can_handle, handle) with the methods pre-bound for dispatch
+        self._bound: Tuple[Tuple[EventHandler, Callable, Callable], ...] = ()
+        # Event type -> (handler, handle) pairs that accept it, filled lazily
+        self._routes: Dict[str, Tuple[Tuple[EventHandler, Callable], ...]] = {}
+        self._frozen = False
     
     def register(self, handler: EventHandler) -> None:
         """Register a handler and keep order by priority."""
+        if self._frozen:
+            raise RuntimeError("Cannot register handlers on a frozen EventRegistry")
+
         self._handlers.append(handler)
-        self._handlers.sort(key=lambda h: h.priority)
+        self._handlers.sort(key=attrgetter("priority"))
+        self._bind()
+
+        # Index the handler under its concrete classes for O(1) lookups
+        for cls in type(handler).__mro__:
+            if cls is EventHandler:
+                break
+            self._by_class.setdefault(cls, handler)
+
+    def freeze(self) -> None:
+        """Lock the handler set once setup is complete.
+
+        register() refuses new handlers from then on; dispatch already reads
+        the immutable ``_bound`` tuple, so the list itself is left in place.
+        """
+        self._frozen = True
+
+    def _bind(self) -> None:
+        self._bound = tuple((h, h.can_handle, h.handle) for h in self._handlers)
+        self.invalidate_routes()
+
+    def invalidate_routes(self) -> None:
+        """Forget cached routing after a handler changes what it accepts."""
+        self._routes.clear()
+
+    def _route(self, event_type: str) -> Tuple[Tuple[EventHandler, Callable], ...]:
+        """Return the handlers for an event type, asking can_handle only once."""
+        route = self._routes.get(event_type)
+        if route is None:
+            route = tuple(
+                (handler, handle)
+                for handler, can_handle, handle in self._bound
+                if can_handle(event_type)
+            )
+            self._routes[event_type] = route
+        return route
+
+    def get_handler(self, handler_type: Type[HandlerT]) -> Optional[HandlerT]:
+        """Return the first registered handler of the given type."""
+        return self._by_class.get(handler_type)
     
+    def classify(self, event: Dict[str, Any]) -> Optional[str]:
+        """Return a coalescing key for events superseded by later ones.
+
+        Streaming ``current_tool_use`` events carry the cumulative tool state,
+        so only the latest one per tool id needs to be dispatched. Every other
+        event (text chunks in particular) is unique and returns ``None``.
+        """
+        tool_use = event.get("current_tool_use")
+        if tool_use:
+            tool_id = tool_use.get("toolUseId")
+            if tool_id:
+                return f"tool:{tool_id}"
+        return None
+
     def get_handlers(self, event_type: str) -> List[EventHandler]:
         """Return handlers that can process the given event type."""
-        return [h for h in self._handlers if h.can_handle(event_type)]
+        return [handler for handler, _ in self._route(event_type)]
     
     def process_event(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Dispatch an event and collect handler outputs."""
-        results = []
         event_type = self._extract_event_type(event)
-        
-        for handler in self.get_handlers(event_type):
+        route = self._route(event_type)
+        if not route:
+            return []
+
+        results = []
+        for handler, handle in route:
             try:
-                result = handler.handle(event)
+                result = handle(event)
                 if result:
                     results.append(result)
             except Exception as e:
@@ -91,17 +174,19 @@ class EventRegistry:
 
         return results
     
+    def process_events(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Dispatch a batch of events in order and collect all handler outputs."""
+        results = []
+        for event in events:
+            results.extend(self.process_event(event))
+        return results
+
     def _extract_event_type(self, event: Dict[str, Any]) -> str:
         """Infer the event type from the payload."""
         # Priority: data > current_tool_use > reasoningText > fallback to first key
-        priority_events = ["data", "current_tool_use", "tool_result", "reasoning", "reasoningText", "redactedContent", "result", "force_stop"]
-        
-        for priority_event in priority_events:
+        for priority_event in _PRIORITY_EVENTS:
             if priority_event in event:
                 return priority_event
         
         # Fall back to the first key if no known type is present
-        for key in event.keys():
-            return key
-        
-        return "unknown"
+        return next(iter(event), "unknown")
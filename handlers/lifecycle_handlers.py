@@ -1,56 +1,82 @@
 """Lifecycle and logging-related event handlers."""
-from typing import Any, Dict, Optional
+from collections import deque
+from pathlib import Path
+from typing import Any, ClassVar, Dict, FrozenSet, Optional
+import functools
 import os
+import sys
 
 from .event_handlers import EventHandler, EventType
 
 
+# Event keys kept per entry in the debug log
+DEBUG_KEY_LIMIT = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _debug_logging_enabled() -> bool:
+    """Read DEBUG_LOGGING once per process from .env or the environment."""
+    # Check .env file first
+    try:
+        env_file = Path(".env")
+        if env_file.exists():
+            for line in env_file.read_text().splitlines():
+                line = line.strip()
+                if line.startswith('DEBUG_LOGGING='):
+                    value = line.split('=', 1)[1].strip().strip('"').strip("'")
+                    return value.lower() in ('true', '1', 'yes', 'on')
+    except Exception:
+        pass
+
+    # Fallback to system environment variable
+    debug_env = os.environ.get('DEBUG_LOGGING', 'false')
+    return debug_env.lower() in ('true', '1', 'yes', 'on')
+
+
 class LifecycleHandler(EventHandler):
     """Handle lifecycle events emitted by the agent."""
 
-    @property
-    def priority(self) -> int:
-        return 50  # Medium priority
+    _EVENTS: ClassVar[FrozenSet[str]] = frozenset({
+        EventType.INIT_EVENT_LOOP.value,
+        EventType.START_EVENT_LOOP.value,
+        EventType.START.value,
+        EventType.MESSAGE.value,
+        EventType.EVENT.value,
+        EventType.COMPLETE.value,
+    })
+
+    priority: ClassVar[int] = 50  # Medium priority
 
     def can_handle(self, event_type: str) -> bool:
         """Handle lifecycle-related event types only."""
-        lifecycle_events = {
-            EventType.INIT_EVENT_LOOP.value,
-            EventType.START_EVENT_LOOP.value,
-            EventType.START.value,
-            EventType.MESSAGE.value,
-            EventType.EVENT.value,
-            EventType.COMPLETE.value,
-        }
-        return event_type in lifecycle_events
+        return event_type in self._EVENTS
     
     def handle(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process a lifecycle event and return metadata."""
-        event_type = next(iter(event.keys()))
+        event_type = next(iter(event))
 
         return {"lifecycle_processed": event_type}
 
 
 class ReasoningHandler(EventHandler):
     """Handle reasoning-related events."""
+
+    _EVENTS: ClassVar[FrozenSet[str]] = frozenset({
+        EventType.REASONING.value,
+        EventType.REASONING_TEXT.value,
+        EventType.REASONING_SIGNATURE.value,
+        EventType.REDACTED_CONTENT.value,
+    })
     
-    @property
-    def priority(self) -> int:
-        return 30  # Higher priority than lifecycle
+    priority: ClassVar[int] = 30  # Higher priority than lifecycle
     
     def can_handle(self, event_type: str) -> bool:
         """React only to reasoning events."""
-        reasoning_events = {
-            EventType.REASONING.value,
-            EventType.REASONING_TEXT.value,
-            EventType.REASONING_SIGNATURE.value,
-            EventType.REDACTED_CONTENT.value,
-        }
-        return event_type in reasoning_events
+        return event_type in self._EVENTS
     
     def handle(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Record the reasoning event."""
-        event_type = next(iter(event.keys()))
+        event_type = next(iter(event))
 
         return {"reasoning_processed": event_type}
 
@@ -59,41 +85,21 @@ class LoggingHandler(EventHandler):
     """Structured logging handler for every event."""
 
     def __init__(self, log_level: str = "INFO"):
-        self.debug_logging = self._get_debug_setting()
+        self.debug_logging = _debug_logging_enabled()
 
-    @property
-    def priority(self) -> int:
-        return 80  # Lower priority so other handlers execute first
+    priority: ClassVar[int] = 80  # Lower priority so other handlers execute first
 
     def can_handle(self, event_type: str) -> bool:
-        """Log every event regardless of type."""
-        return True
+        """Log every event type, but only while debug logging is on."""
+        return self.debug_logging
     
-    def _get_debug_setting(self) -> bool:
-        """Get debug logging setting from environment variables."""
-        # Check .env file first
-        try:
-            from pathlib import Path
-            env_file = Path(".env")
-            if env_file.exists():
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('DEBUG_LOGGING='):
-                            value = line.split('=', 1)[1].strip().strip('"').strip("'")
-                            return value.lower() in ('true', '1', 'yes', 'on')
-        except Exception:
-            pass
-
-        # Fallback to system environment variable
-        debug_env = os.environ.get('DEBUG_LOGGING', 'false')
-        return debug_env.lower() in ('true', '1', 'yes', 'on')
-
     def handle(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Log the event with structured metadata."""
         # Only show debug events if DEBUG_LOGGING is enabled
-        if self.debug_logging:
-            print(f"\n🔍 EVENT: {event}")
+        if not self.debug_logging:
+            return None
+
+        sys.stderr.write(f"\n🔍 EVENT: {event}\n")
 
         # Reasoning content detection removed for cleaner output
 
@@ -107,11 +113,10 @@ class DebugHandler(EventHandler):
     
     def __init__(self, debug_enabled: bool = False):
         self.debug_enabled = debug_enabled
-        self.event_log = []
+        # Keep only the latest 100 events; the deque evicts the oldest
+        self.event_log: deque = deque(maxlen=100)
     
-    @property
-    def priority(self) -> int:
-        return 95  # Lowest priority
+    priority: ClassVar[int] = 95  # Lowest priority
     
     def can_handle(self, event_type: str) -> bool:
         """Only process events when debug mode is enabled."""
@@ -122,16 +127,8 @@ class DebugHandler(EventHandler):
         if not self.debug_enabled:
             return None
         
-        event_type = next(iter(event.keys()))
-        
-        # Append a shallow copy for debugging purposes
-        self.event_log.append({
-            "event_type": event_type,
-            "event_data": event.copy(),
-        })
-
-        # Limit to the latest 100 events
-        if len(self.event_log) > 100:
-            self.event_log.pop(0)
+        # Record only the event's leading keys; formatting the payload (repr)
+        # would cost as much as the event itself
+        self.event_log.append(tuple(event)[:DEBUG_KEY_LIMIT])
 
         return None
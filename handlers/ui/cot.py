@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-import re
+from typing import List, Optional
 
 import streamlit as st
 
@@ -15,30 +14,19 @@ class COTUIManager:
 
     def __init__(self, ui_state: StreamlitUIState):
         self.ui_state = ui_state
-        self._thinking_pattern = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL)
+        self._open_tag = "<thinking>"
+        self._close_tag = "</thinking>"
         self._in_thinking = False
-        self._thinking_buffer = ""
-        self._initial_buffer = ""
-        self._buffer_checked = False
-        self._buffer_size = 20
+        # Trailing characters that may be the start of a tag split across chunks
+        self._carry = ""
+        self._cot_chunks: List[str] = []
+        # Only the first thinking block becomes the chain of thought, as in
+        # utils.parse_model_response; later blocks are filtered out
+        self._cot_captured = False
 
     # ------------------------------------------------------------------
-    def can_handle(self, event: Dict[str, Any]) -> bool:
-        # Handle data events that might contain <thinking> blocks
-        return "data" in event
-
-    def handle(self, event: Dict[str, Any]) -> None:
-        if "data" in event:
-            data = event.get("data", "")
-            self._process_thinking_data(data)
-
-    # ------------------------------------------------------------------
-    def _process_thinking_data(self, data: str) -> None:
-        """Process data and detect thinking blocks character by character."""
-        # The filtering logic now handles the thinking detection
-        # This method is mainly for consistency, actual work is done in filter_thinking_from_data
-        pass
-
+    # Data events reach this manager only through filter_thinking_from_data,
+    # which MessageUIManager calls for every streamed chunk
     def _ensure_cot_status(self) -> None:
         """Create simple COT status container (no nesting)."""
         if self.ui_state.cot.status:
@@ -93,60 +81,58 @@ class COTUIManager:
         """Remove thinking blocks from streaming data for clean text output.
 
         This should be called BEFORE handle() to get the correct filtering.
+        Each chunk is scanned once; only a possible partial tag at its end
+        is held back until the next chunk arrives.
         """
         if not data:
             return data
 
-        # Buffer initial characters to detect thinking pattern
-        if not self._buffer_checked:
-            self._initial_buffer += data
-
-            # If we haven't collected enough characters yet, don't output anything
-            if len(self._initial_buffer) < self._buffer_size:
-                return ""
-
-            # Check if thinking pattern exists in the initial buffer
-            if '<thinking>' in self._initial_buffer:
-                self._in_thinking = True
-                self._ensure_cot_status()
-                # Find where thinking starts and return text before it (if any)
-                thinking_start = self._initial_buffer.find('<thinking>')
-                self._buffer_checked = True
-                return self._initial_buffer[:thinking_start]
-            else:
-                # No thinking pattern, return the buffered data and continue normally
-                self._buffer_checked = True
-                return self._initial_buffer
-
-        # After initial buffer check, handle normally
-        if self._in_thinking:
-            # Add to thinking buffer (include the initial buffer if it hasn't been processed)
-            if not hasattr(self, '_initial_added_to_thinking'):
-                # Add the part of initial buffer that contains <thinking>
-                thinking_start = self._initial_buffer.find('<thinking>')
-                self._thinking_buffer = self._initial_buffer[thinking_start:]
-                self._initial_added_to_thinking = True
-
-            self._thinking_buffer += data
-
-            # Check if thinking ends in this chunk
-            if '</thinking>' in self._thinking_buffer:
+        text = self._carry + data
+        self._carry = ""
+        output: List[str] = []
+
+        while text:
+            tag = self._close_tag if self._in_thinking else self._open_tag
+            index = text.find(tag)
+
+            if index == -1:
+                keep = self._partial_tag_length(text, tag)
+                body = text[:len(text) - keep]
+                self._carry = text[len(text) - keep:]
+                if not self._in_thinking:
+                    output.append(body)
+                elif not self._cot_captured:
+                    self._cot_chunks.append(body)
+                break
+
+            if self._in_thinking:
                 self._in_thinking = False
-                # Extract thinking content
-                matches = self._thinking_pattern.findall(self._thinking_buffer)
-                if matches:
-                    self.ui_state.cot.text = matches[-1].strip()
-
-                # Find where thinking ends and return text after it
-                thinking_end = self._thinking_buffer.find('</thinking>') + len('</thinking>')
-                after_thinking = self._thinking_buffer[thinking_end:]
-                return after_thinking
+                if not self._cot_captured:
+                    self._cot_chunks.append(text[:index])
+                    self.ui_state.cot.text = "".join(self._cot_chunks).strip()
+                    self._cot_captured = True
+                    self._cot_chunks = []
             else:
-                # Still inside thinking block, don't output anything
-                return ""
-        else:
-            # Normal streaming after buffer check
-            return data
+                output.append(text[:index])
+                self._in_thinking = True
+                self._ensure_cot_status()
+
+            text = text[index + len(tag):]
+
+        return "".join(output)
+
+    def flush_pending(self) -> str:
+        """Release held-back text once the stream has ended."""
+        pending, self._carry = self._carry, ""
+        return "" if self._in_thinking else pending
+
+    @staticmethod
+    def _partial_tag_length(text: str, tag: str) -> int:
+        """Length of the longest suffix of ``text`` that starts ``tag``."""
+        for length in range(min(len(tag) - 1, len(text)), 0, -1):
+            if text.endswith(tag[:length]):
+                return length
+        return 0
 
     def has_cot_content(self) -> bool:
         """Check if there's any COT content to display."""
@@ -154,9 +140,7 @@ class COTUIManager:
 
     def reset_for_new_conversation(self) -> None:
         """Reset COT state for a new conversation."""
-        self._thinking_buffer = ""
         self._in_thinking = False
-        self._initial_buffer = ""
-        self._buffer_checked = False
-        if hasattr(self, '_initial_added_to_thinking'):
-            delattr(self, '_initial_added_to_thinking')
\ No newline at end of file
+        self._carry = ""
+        self._cot_chunks = []
+        self._cot_captured = False
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+from collections import namedtuple
 from typing import Any, Dict, Optional
 
 import streamlit as st
@@ -10,7 +12,33 @@ from . import utils
 from .placeholders import safe_markdown
 from .state import StreamlitUIState
 
+# Minimum seconds between streaming re-renders of the response placeholder
+FLUSH_INTERVAL = 0.05
 
+# Unrendered characters that force a re-render before the interval elapses
+FLUSH_CHARS = 64
+
+# Event keys that MessageUIManager reacts to
+_TRIGGER_KEYS = frozenset(("data", "result", "force_stop"))
+
+# Tool identity and input pulled from a metrics entry, dict or object alike
+_ToolView = namedtuple("_ToolView", "tool_id raw_input name")
+
+
+def _read(obj: Any, attr: str) -> Any:
+    """Read a field from either a plain dict or an SDK object."""
+    if isinstance(obj, dict):
+        return obj.get(attr)
+    return getattr(obj, attr, None)
+
+
+def _view(tool_info: Any) -> _ToolView:
+    """Normalize a tool description from the agent metrics."""
+    return _ToolView(
+        _read(tool_info, "toolUseId") or _read(tool_info, "tool_use_id"),
+        _read(tool_info, "input") or _read(tool_info, "arguments"),
+        _read(tool_info, "name"),
+    )
 
 
 def render_chain_of_thought(chain_of_thought: Optional[str]) -> None:
@@ -30,7 +58,7 @@ class MessageUIManager:
 
     # ------------------------------------------------------------------
     def can_handle(self, event: Dict[str, Any]) -> bool:
-        return any(key in event for key in ("data", "result", "force_stop"))
+        return not _TRIGGER_KEYS.isdisjoint(event)
 
     def handle(self, event: Dict[str, Any]) -> None:
         if "data" in event:
@@ -46,9 +74,8 @@ class MessageUIManager:
         message_state = self.ui_state.message
         assistant_message = self.ui_state.assistant_message
 
+        # The caller allocates a container only when the final render needs one
         final_container = None
-        if self.ui_state.message_container:
-            final_container = self.ui_state.message_container.empty()
 
         if message_state.force_stop_error:
             assistant_message["text"] = message_state.force_stop_error
@@ -61,8 +88,16 @@ class MessageUIManager:
                 "force_stop": True,
             }
 
+        # Text held back as a possible partial tag belongs to the response
+        if self.cot_manager:
+            message_state.append_filtered(self.cot_manager.flush_pending())
+
+        # Text of the final message, extracted at most once and only if needed
+        final_text = None
+
         if not message_state.raw_response and message_state.final_message:
-            message_state.raw_response = self._extract_text_from_message(message_state.final_message)
+            final_text = self._extract_text_from_message(message_state.final_message)
+            message_state.raw_response = final_text
             # Don't set filtered_response = raw_response, let it be processed properly
 
         # Use filtered response for final display (no thinking blocks)
@@ -70,19 +105,24 @@ class MessageUIManager:
 
         # If no display text, try to extract from final message
         if not display_text and message_state.final_message:
-            raw_text = self._extract_text_from_message(message_state.final_message)
+            if final_text is None:
+                final_text = self._extract_text_from_message(message_state.final_message)
+            raw_text = final_text
             if raw_text and self.cot_manager:
                 # Apply COT filtering to final message text
-                import re
-                thinking_pattern = re.compile(r'<thinking>.*?</thinking>', re.DOTALL)
-                display_text = thinking_pattern.sub('', raw_text).strip()
+                if '<thinking>' in raw_text:
+                    raw_text = utils.THINKING_PATTERN.sub('', raw_text)
+                display_text = raw_text.strip()
 
         # Fallback only if truly no content
         if not display_text:
             display_text = "*No response generated.*"
 
-        # Extract chain of thought from raw response
-        _, chain_of_thought = utils.parse_model_response(message_state.raw_response)
+        # Reuse the chain of thought the streaming filter already extracted;
+        # parse the raw response only when it was not streamed through it
+        chain_of_thought = self.ui_state.cot.text or None
+        if chain_of_thought is None and "<thinking>" in message_state.raw_response:
+            _, chain_of_thought = utils.parse_model_response(message_state.raw_response)
 
         assistant_message["text"] = display_text
         assistant_message["chain_of_thought"] = chain_of_thought
@@ -96,14 +136,56 @@ class MessageUIManager:
         }
 
     def render_final_text(self, text: str, final_container: Optional[Any]) -> None:
-        self._render_final_text(text, final_container)
+        if final_container is not None:
+            with final_container:
+                st.markdown(text)
+        else:
+            safe_markdown(self.ui_state.response_placeholder, text)
+
+    def flush(self, force: bool = False) -> None:
+        """Render pending streamed text once FLUSH_INTERVAL or FLUSH_CHARS is reached."""
+        message_state = self.ui_state.message
+        if not message_state.dirty:
+            return
+
+        placeholder = self.ui_state.response_placeholder
+        if not placeholder:
+            return
+
+        now = time.monotonic()
+        if (
+            not force
+            and now - message_state.last_flush < FLUSH_INTERVAL
+            and message_state.pending_chars < FLUSH_CHARS
+        ):
+            return
+
+        # Leading whitespace was dropped when the first chunk was appended
+        display_text = message_state.filtered_response.rstrip()
+        # Whitespace-only deltas leave the visible text unchanged
+        if display_text != message_state.last_rendered:
+            if display_text:
+                placeholder.markdown(f"{display_text}▌")
+            else:
+                placeholder.markdown("▌")
+            message_state.last_rendered = display_text
+        message_state.dirty = False
+        message_state.pending_chars = 0
+        message_state.last_flush = now
 
     def handle_force_stop(self, reason: str) -> None:
+        # The error replaces any streamed text that is still pending
+        self.ui_state.message.dirty = False
         self.ui_state.message.force_stop_error = f"Error: {reason}"
         safe_markdown(self.ui_state.response_placeholder, f":red[{self.ui_state.message.force_stop_error}]")
 
     def render_force_stop_message(self, final_container: Optional[Any]) -> None:
-        self._render_force_stop(final_container)
+        error_text = f":red[{self.ui_state.message.force_stop_error}]"
+        if final_container is not None:
+            with final_container:
+                st.markdown(error_text)
+        else:
+            safe_markdown(self.ui_state.response_placeholder, error_text)
 
     # ------------------------------------------------------------------
     def _handle_data(self, data_chunk: str) -> None:
@@ -111,7 +193,7 @@ class MessageUIManager:
             return
 
         # Store raw response for later processing
-        self.ui_state.message.raw_response += data_chunk
+        self.ui_state.message.append_raw(data_chunk)
 
         # Filter this chunk BEFORE updating COT state
         if self.cot_manager:
@@ -119,62 +201,48 @@ class MessageUIManager:
         else:
             filtered_chunk = data_chunk  # Fallback
 
-        self.ui_state.message.filtered_response += filtered_chunk
+        # Chunks inside a thinking block add nothing visible to the response
+        if not filtered_chunk:
+            return
 
-        # Display the accumulated filtered text if placeholder exists
-        placeholder = self.ui_state.response_placeholder
-        if placeholder:
-            display_text = self.ui_state.message.filtered_response.strip()
-            if display_text:
-                placeholder.markdown(f"{display_text}▌")
-            else:
-                placeholder.markdown("▌")
+        self.ui_state.message.append_filtered(filtered_chunk)
+
+        # Display the accumulated filtered text unless a render just happened
+        self.ui_state.message.dirty = True
+        self.ui_state.message.pending_chars += len(filtered_chunk)
+        self.flush()
 
     def _handle_result(self, agent_result: Any) -> None:
-        if hasattr(agent_result, "message") and agent_result.message:
-            self.ui_state.message.final_message = agent_result.message
-        elif isinstance(agent_result, dict):
-            self.ui_state.message.final_message = agent_result.get("message")
+        message = _read(agent_result, "message")
+        if message:
+            self.ui_state.message.final_message = message
 
         if agent_result:
             self._backfill_tool_inputs_from_metrics(agent_result)
 
-    def _render_force_stop(self, final_container: Optional[Any]) -> None:
-        error_text = f":red[{self.ui_state.message.force_stop_error}]"
-        if final_container is not None:
-            with final_container:
-                st.markdown(error_text)
-        else:
-            safe_markdown(self.ui_state.response_placeholder, error_text)
-
-    def _render_final_text(self, text: str, final_container: Optional[Any]) -> None:
-        if final_container is not None:
-            with final_container:
-                st.markdown(text)
-        else:
-            safe_markdown(self.ui_state.response_placeholder, text)
-
     def _get_filtered_display_text(self) -> str:
         """Get display text with thinking blocks removed."""
         # Use the filtered response that was built during streaming
         text = self.ui_state.message.filtered_response.strip()
 
+        # Most responses carry no thinking tags; skip the regex for them
+        if '<thinking>' not in text and '</thinking>' not in text:
+            return text
+
         # Additional cleanup for any remaining thinking tags
         if text:
-            import re
             # Remove complete thinking blocks
-            thinking_pattern = re.compile(r'<thinking>.*?</thinking>', re.DOTALL)
-            text = thinking_pattern.sub('', text).strip()
+            text = utils.THINKING_PATTERN.sub('', text).strip()
 
             # Remove any partial thinking tags (opening tags without closing)
-            if '<thinking>' in text:
-                text = text.split('<thinking>')[0].strip()
+            start = text.find('<thinking>')
+            if start != -1:
+                text = text[:start].strip()
 
-            # Remove any orphaned closing tags
-            if '</thinking>' in text:
-                parts = text.split('</thinking>')
-                if len(parts) > 1:
-                    text = ''.join(parts[1:]).strip()
+            # Remove any orphaned closing tags and the text before the first one
+            end = text.find('</thinking>')
+            if end != -1:
+                text = text[end + len('</thinking>'):].replace('</thinking>', '').strip()
 
         return text
 
@@ -186,82 +254,74 @@ class MessageUIManager:
 
         content = message.get("content") if isinstance(message, dict) else None
         if isinstance(content, list):
-            for item in content:
-                text = item.get("text")
-                if text:
-                    return text
+            return next(
+                (item["text"] for item in content if isinstance(item, dict) and item.get("text")),
+                "",
+            )
         if isinstance(content, str):
             return content
         return ""
 
     # ------------------------------------------------------------------
     def _backfill_tool_inputs_from_metrics(self, agent_result: Any) -> bool:
-        metrics = getattr(agent_result, "metrics", None)
-        if metrics is None and isinstance(agent_result, dict):
-            metrics = agent_result.get("metrics")
+        # Only tool calls streamed in this response need their inputs filled
+        if not self.ui_state.assistant_message["tool_calls"]:
+            return False
+
+        metrics = _read(agent_result, "metrics")
         if not metrics:
             return False
 
-        tool_metrics = getattr(metrics, "tool_metrics", None)
-        if tool_metrics is None and isinstance(metrics, dict):
-            tool_metrics = metrics.get("tool_metrics")
+        tool_metrics = _read(metrics, "tool_metrics")
         if not tool_metrics:
             return False
 
         metric_entries = tool_metrics.values() if isinstance(tool_metrics, dict) else tool_metrics
+        get_entry = self._get_or_create_tool_entry
+        update_input = self._update_tool_entry_input
         updated = False
 
         for metric in metric_entries:
-            tool_info = getattr(metric, "tool", None)
-            if tool_info is None and isinstance(metric, dict):
-                tool_info = metric.get("tool")
+            tool_info = _read(metric, "tool")
             if not tool_info:
                 continue
 
-            if isinstance(tool_info, dict):
-                tool_id = tool_info.get("toolUseId") or tool_info.get("tool_use_id")
-                raw_input = tool_info.get("input") or tool_info.get("arguments")
-                name = tool_info.get("name")
-            else:
-                tool_id = getattr(tool_info, "toolUseId", None) or getattr(tool_info, "tool_use_id", None)
-                raw_input = getattr(tool_info, "input", None) or getattr(tool_info, "arguments", None)
-                name = getattr(tool_info, "name", None)
-
-            if raw_input in (None, ""):
+            view = _view(tool_info)
+            if view.raw_input in (None, ""):
                 continue
 
-            tool_entry = self._get_or_create_tool_entry(tool_id, name)
+            tool_entry = get_entry(view.tool_id, view.name)
             if not tool_entry:
                 continue
 
-            if self._update_tool_entry_input(tool_entry, raw_input):
+            if update_input(tool_entry, view.raw_input):
                 updated = True
 
         return updated
 
     def _get_or_create_tool_entry(self, tool_id: Optional[str], name: Optional[str]) -> Optional[Dict[str, Any]]:
-        if tool_id and tool_id in self.ui_state.tool_map:
-            return self.ui_state.tool_map[tool_id]
+        ui_state = self.ui_state
+
+        if tool_id and tool_id in ui_state.tool_map:
+            return ui_state.tool_map[tool_id]
 
         if not tool_id and name:
-            for entry in self.ui_state.assistant_message["tool_calls"]:
-                if entry.get("name") == name:
-                    return entry
+            entry = ui_state.tool_names.get(name)
+            if entry is not None:
+                return entry
 
         if not tool_id and not name:
             return None
 
         entry = {
-            "name": name or f"Tool {len(self.ui_state.assistant_message['tool_calls']) + 1}",
+            "name": name or ui_state.next_tool_name(),
             "tool_use_id": tool_id,
             "input": None,
             "input_is_json": False,
             "result": None,
             "result_is_json": False,
         }
-        self.ui_state.assistant_message["tool_calls"].append(entry)
-        if tool_id:
-            self.ui_state.tool_map[tool_id] = entry
+        ui_state.register_tool(entry)
         return entry
 
     def _update_tool_entry_input(self, tool_entry: Dict[str, Any], raw_input: Any) -> bool:
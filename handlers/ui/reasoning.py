@@ -61,7 +61,7 @@ class ReasoningUIManager:
             return
 
         self._ensure_reasoning_status()
-        self.ui_state.reasoning.text += reasoning_content
+        self.ui_state.reasoning.append_text(reasoning_content)
 
         status = self.ui_state.reasoning.status
         if status:
@@ -72,15 +72,7 @@ class ReasoningUIManager:
             )
 
     def _handle_event(self, event_data: Dict[str, Any]) -> None:
-        if "contentBlockDelta" not in event_data:
-            return
-
-        delta = event_data["contentBlockDelta"].get("delta", {})
-        if "SDK_UNKNOWN_MEMBER" not in delta:
-            return
-
-        unknown_member = delta["SDK_UNKNOWN_MEMBER"]
-        if unknown_member.get("name") == "reasoningContent":
+        if _is_reasoning_delta(event_data):
             self._ensure_reasoning_status()
 
     def _ensure_reasoning_status(self) -> None:
@@ -97,13 +89,18 @@ class ReasoningUIManager:
         self.ui_state.reasoning.status = status
 
     def _contains_reasoning_event(self, event: Dict[str, Any]) -> bool:
-        if "event" not in event:
-            return False
-        event_data = event["event"]
-        if "contentBlockDelta" not in event_data:
-            return False
-        delta = event_data["contentBlockDelta"].get("delta", {})
-        unknown_member = delta.get("SDK_UNKNOWN_MEMBER")
-        if not isinstance(unknown_member, dict):
-            return False
-        return unknown_member.get("name") == "reasoningContent"
+        return _is_reasoning_delta(event.get("event"))
+
+
+def _is_reasoning_delta(event_data: Any) -> bool:
+    """Return True for a raw stream event announcing reasoning content."""
+    if not event_data:
+        return False
+    block_delta = event_data.get("contentBlockDelta")
+    if not block_delta:
+        return False
+    delta = block_delta.get("delta")
+    if not isinstance(delta, dict):
+        return False
+    unknown_member = delta.get("SDK_UNKNOWN_MEMBER")
+    return isinstance(unknown_member, dict) and unknown_member.get("name") == "reasoningContent"
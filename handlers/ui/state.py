@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, List, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceholderState:
     """Top-level Streamlit placeholders shared by the managers."""
 
@@ -17,15 +18,33 @@ class PlaceholderState:
     message_container: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningState:
     """Reasoning-specific UI state."""
 
     status: Any = None
-    text: str = ""
+    text_parts: List[str] = field(default_factory=list)
+    _text_joined: str | None = field(default="", repr=False)
+
+    @property
+    def text(self) -> str:
+        """Accumulated reasoning text, joined from the deltas when first read."""
+        if self._text_joined is None:
+            self._text_joined = "".join(self.text_parts)
+        return self._text_joined
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.text_parts = [value] if value else []
+        self._text_joined = value
+
+    def append_text(self, chunk: str) -> None:
+        """Record a reasoning delta without copying the accumulated text."""
+        self.text_parts.append(chunk)
+        self._text_joined = None
 
 
-@dataclass
+@dataclass(slots=True)
 class COTState:
     """Chain of Thought UI state."""
 
@@ -33,33 +52,91 @@ class COTState:
     text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolRenderState:
     """Bookkeeping for dynamically created tool placeholders."""
 
     placeholders: Dict[str, Any] = field(default_factory=dict)
+    # Last (status, name, input, result) rendered into each placeholder
+    signatures: Dict[str, Any] = field(default_factory=dict)
+    # Keys of tool entries still waiting for a result
+    running: Set[Any] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageState:
     """State associated with streaming and final messages."""
 
-    raw_response: str = ""
-    filtered_response: str = ""
+    raw_response_parts: List[str] = field(default_factory=list)
+    # Read on every throttled flush, so kept contiguous rather than as parts
+    filtered_buffer: io.StringIO = field(default_factory=io.StringIO, repr=False)
     final_message: Any = None
     force_stop_error: str | None = None
     assistant_appended: bool = False
+    dirty: bool = False
+    pending_chars: int = 0
+    last_flush: float = 0.0
+    last_rendered: str | None = None
+    _raw_joined: str | None = field(default="", repr=False)
+    _filtered_joined: str | None = field(default="", repr=False)
+
+    @property
+    def raw_response(self) -> str:
+        """Full raw text, joined from the streamed chunks when first read."""
+        if self._raw_joined is None:
+            self._raw_joined = "".join(self.raw_response_parts)
+        return self._raw_joined
+
+    @raw_response.setter
+    def raw_response(self, value: str) -> None:
+        self.raw_response_parts = [value] if value else []
+        self._raw_joined = value
+
+    def append_raw(self, chunk: str) -> None:
+        """Record a streamed chunk without copying the accumulated text."""
+        self.raw_response_parts.append(chunk)
+        self._raw_joined = None
+
+    @property
+    def filtered_response(self) -> str:
+        """Displayable text (thinking removed), copied out when first read."""
+        if self._filtered_joined is None:
+            self._filtered_joined = self.filtered_buffer.getvalue()
+        return self._filtered_joined
+
+    @filtered_response.setter
+    def filtered_response(self, value: str) -> None:
+        self.filtered_buffer = io.StringIO()
+        self.filtered_buffer.write(value)
+        self._filtered_joined = value
+
+    def append_filtered(self, chunk: str) -> None:
+        """Record a filtered chunk without copying the accumulated text.
+
+        Leading whitespace is dropped once, at the start of the response, so
+        readers only ever need to trim the trailing edge.
+        """
+        if not self.filtered_buffer.tell():
+            chunk = chunk.lstrip()
+        if chunk:
+            self.filtered_buffer.write(chunk)
+            self._filtered_joined = None
+
+
+# Scalar defaults for a new assistant message; tool_calls is added per copy
+_ASSISTANT_TEMPLATE: Dict[str, Any] = {
+    "text": "",
+    "chain_of_thought": None,
+}
 
 
 def _empty_assistant_message() -> Dict[str, Any]:
-    return {
-        "text": "",
-        "chain_of_thought": None,
-        "tool_calls": [],
-    }
+    message = _ASSISTANT_TEMPLATE.copy()
+    message["tool_calls"] = []
+    return message
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamlitUIState:
     """Root state object shared across UI managers."""
 
@@ -70,6 +147,25 @@ class StreamlitUIState:
     message: MessageState = field(default_factory=MessageState)
     assistant_message: Dict[str, Any] = field(default_factory=_empty_assistant_message)
     tool_map: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # First tool entry seen for each name, for results that carry no id
+    tool_names: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Number of tool entries registered during the current stream
+    tool_counter: int = 0
+
+    def next_tool_name(self) -> str:
+        """Fallback display name for a tool call that arrived without one."""
+        return f"Tool {self.tool_counter + 1}"
+
+    def register_tool(self, tool_entry: Dict[str, Any]) -> None:
+        """Append a tool entry and index it by id and by name."""
+        self.tool_counter += 1
+        self.assistant_message["tool_calls"].append(tool_entry)
+        tool_id = tool_entry.get("tool_use_id")
+        if tool_id:
+            self.tool_map[tool_id] = tool_entry
+        name = tool_entry.get("name")
+        if name:
+            self.tool_names.setdefault(name, tool_entry)
 
     def reset(self) -> None:
         """Reset per-stream state while keeping placeholder references."""
@@ -79,6 +175,8 @@ class StreamlitUIState:
         self.message = MessageState()
         self.assistant_message = _empty_assistant_message()
         self.tool_map = {}
+        self.tool_names = {}
+        self.tool_counter = 0
 
     # Convenience aliases for legacy attribute access ---------------------
     @property
@@ -10,6 +10,12 @@ from . import utils
 from .placeholders import create_placeholder, safe_empty
 from .state import StreamlitUIState
 
+# Event keys that ToolUIManager reacts to
+_TOOL_EVENT_KEYS = frozenset({"current_tool_use", "tool_result", "event", "force_stop"})
+
+# Identifier keys dropped from a tool result shown without output/content
+_TOOL_ID_KEYS = frozenset({"toolUseId", "tool_use_id"})
+
 
 def render_tool_calls(tool_calls: Iterable[Dict[str, Any]]) -> None:
     """Render completed tool calls as simple status widgets."""
@@ -19,29 +25,33 @@ def render_tool_calls(tool_calls: Iterable[Dict[str, Any]]) -> None:
         with st.status(f"✅ Tool: {title_name}", state="complete", expanded=False):
             tool_use_id = call.get("tool_use_id")
             if tool_use_id:
-                st.write(f"**Tool ID:** {tool_use_id}")
+                st.markdown(f"**Tool ID:** {tool_use_id}")
 
             input_value = call.get("input")
             if input_value is not None:
-                st.write("**Input:**")
+                st.markdown("**Input:**")
                 utils.render_tool_value(input_value, call.get("input_is_json", False))
 
             result_value = call.get("result")
             if result_value is not None:
-                st.write("**Result:**")
+                st.markdown("**Result:**")
                 utils.render_tool_value(result_value, call.get("result_is_json", False))
 
 
 class ToolUIManager:
     """Handle tool invocation events and UI rendering."""
 
+    _STATUS_PREFIX = {
+        "running": "🔧",
+        "error": "❌",
+    }
+
     def __init__(self, ui_state: StreamlitUIState):
         self.ui_state = ui_state
 
     # ------------------------------------------------------------------
     def can_handle(self, event: Dict[str, Any]) -> bool:
-        keys = {"current_tool_use", "tool_result", "event", "force_stop"}
-        return any(key in event for key in keys)
+        return not _TOOL_EVENT_KEYS.isdisjoint(event)
 
     def handle(self, event: Dict[str, Any]) -> None:
         if "current_tool_use" in event:
@@ -55,36 +65,44 @@ class ToolUIManager:
 
     # ------------------------------------------------------------------
     def finalize(self) -> None:
-        """Finalize tool status to complete state."""
-        # Mark all tools as complete
-        for tool_entry in self.ui_state.assistant_message.get("tool_calls", []):
-            self._render_tool_entry(tool_entry, status="complete")
-
-        # Keep placeholders for final display
-        # Note: Don't clear placeholders here as they contain the final tool results
+        """Clear the streaming tool widgets.
+
+        finalize_response renders every completed call in one pass with
+        render_tool_calls, so re-rendering each placeholder here would only
+        duplicate that output.
+        """
+        tools = self.ui_state.tools
+        for placeholder in tools.placeholders.values():
+            placeholder.empty()
+        tools.placeholders.clear()
+        tools.signatures.clear()
+        tools.running.clear()
 
     def mark_force_stop(self) -> None:
+        render = self._render_tool_entry
         for tool_entry in self.ui_state.assistant_message.get("tool_calls", []):
-            self._render_tool_entry(tool_entry, status="error")
+            render(tool_entry, status="error")
 
     # ------------------------------------------------------------------
     def _handle_current_tool_use(self, tool_data: Dict[str, Any]) -> None:
+        tool_map = self.ui_state.tool_map
         tool_id = tool_data.get("toolUseId") or tool_data.get("tool_use_id")
-        if tool_id and tool_id in self.ui_state.tool_map:
-            tool_entry = self.ui_state.tool_map[tool_id]
-        else:
-            input_value, input_is_json = utils.normalize_tool_value(tool_data.get("input"))
-            tool_entry = {
-                "name": tool_data.get("name") or f"Tool {len(self.ui_state.assistant_message['tool_calls']) + 1}",
-                "tool_use_id": tool_id,
-                "input": input_value,
-                "input_is_json": input_is_json,
-                "result": None,
-                "result_is_json": False,
-            }
-            self.ui_state.assistant_message["tool_calls"].append(tool_entry)
-            if tool_id:
-                self.ui_state.tool_map[tool_id] = tool_entry
+        if tool_id and tool_id in tool_map:
+            # Argument deltas for a known tool leave its entry unchanged; the
+            # final input is backfilled from the result metrics
+            return
+
+        input_value, input_is_json = utils.normalize_tool_value(tool_data.get("input"))
+        tool_entry = {
+            "name": tool_data.get("name") or self.ui_state.next_tool_name(),
+            "tool_use_id": tool_id,
+            "input": input_value,
+            "input_is_json": input_is_json,
+            "result": None,
+            "result_is_json": False,
+        }
+        self.ui_state.register_tool(tool_entry)
+        self.ui_state.tools.running.add(self._entry_key(tool_entry))
 
         self._render_tool_entry(tool_entry, status="running")
 
@@ -102,17 +120,19 @@ class ToolUIManager:
                 stripped = {
                     key: value
                     for key, value in payload.items()
-                    if key not in {"toolUseId", "tool_use_id"}
+                    if key not in _TOOL_ID_KEYS
                 }
                 if stripped:
                     display_payload = stripped
 
         value, is_json = utils.normalize_tool_value(display_payload)
 
-        if tool_id and tool_id in self.ui_state.tool_map:
-            tool_entry = self.ui_state.tool_map[tool_id]
-        elif self.ui_state.assistant_message["tool_calls"]:
-            tool_entry = self.ui_state.assistant_message["tool_calls"][-1]
+        tool_map = self.ui_state.tool_map
+        tool_calls = self.ui_state.assistant_message["tool_calls"]
+        if tool_id and tool_id in tool_map:
+            tool_entry = tool_map[tool_id]
+        elif tool_calls:
+            tool_entry = tool_calls[-1]
         else:
             tool_entry = {
                 "name": "Tool",
@@ -122,20 +142,22 @@ class ToolUIManager:
                 "result": None,
                 "result_is_json": False,
             }
-            self.ui_state.assistant_message["tool_calls"].append(tool_entry)
-            if tool_id:
-                self.ui_state.tool_map[tool_id] = tool_entry
+            self.ui_state.register_tool(tool_entry)
 
         tool_entry["result"] = value if value is not None else display_payload
         tool_entry["result_is_json"] = is_json or isinstance(display_payload, (dict, list))
+        self.ui_state.tools.running.discard(self._entry_key(tool_entry))
         self._render_tool_entry(tool_entry, status="running")
 
     def _handle_progress_event(self, event_data: Dict[str, Any]) -> None:
         # Re-render any in-flight tool entries so the spinner remains visible.
-        if not self.ui_state.assistant_message["tool_calls"]:
+        # Once every tool has its result there is nothing left to animate.
+        if not self.ui_state.tools.running:
             return
-        for tool_entry in self.ui_state.assistant_message["tool_calls"]:
-            self._render_tool_entry(tool_entry, status="running")
+        tool_calls = self.ui_state.assistant_message["tool_calls"]
+        render = self._render_tool_entry
+        for tool_entry in tool_calls:
+            render(tool_entry, status="running")
 
     # ------------------------------------------------------------------
     def _render_tool_entry(self, tool_entry: Dict[str, Any], *, status: str) -> None:
@@ -144,41 +166,34 @@ class ToolUIManager:
             return
 
         status = status.lower()
-        title_prefix = {
-            "running": "🔧",
-            "complete": "✅",
-            "error": "❌",
-        }.get(status, "🔧")
+
+        # Progress ticks re-render running tools; skip when nothing changed
+        key = self._entry_key(tool_entry)
+        signature = (status, tool_entry.get("name"), tool_entry.get("input"), tool_entry.get("result"))
+        signatures = self.ui_state.tools.signatures
+        if signatures.get(key) == signature:
+            return
+        signatures[key] = signature
+
+        title_prefix = self._STATUS_PREFIX.get(status, "🔧")
         title_name = tool_entry.get("name") or "Tool"
         label = f"{title_prefix} Tool: {title_name}"
 
         # Simple status without expander nesting
         placeholder.empty()
         with placeholder.container():
-            if status == "running":
-                status_widget = st.status(f"{label}...", state="running", expanded=False)
-            elif status == "error":
-                status_widget = st.status(f"{label} - Error", state="error", expanded=False)
+            # Completed calls are drawn by render_tool_calls once the stream ends
+            if status == "error":
+                st.status(f"{label} - Error", state="error", expanded=False)
             else:
-                # Complete status - fill with content
-                status_widget = st.status(label, state="complete", expanded=False)
-                with status_widget:
-                    tool_use_id = tool_entry.get("tool_use_id")
-                    if tool_use_id:
-                        st.write(f"**Tool ID:** {tool_use_id}")
-
-                    input_value = tool_entry.get("input")
-                    if input_value is not None:
-                        st.write("**Input:**")
-                        utils.render_tool_value(input_value, tool_entry.get("input_is_json", False))
-
-                    result_value = tool_entry.get("result")
-                    if result_value is not None:
-                        st.write("**Result:**")
-                        utils.render_tool_value(result_value, tool_entry.get("result_is_json", False))
+                st.status(f"{label}...", state="running", expanded=False)
+
+    @staticmethod
+    def _entry_key(tool_entry: Dict[str, Any]) -> Any:
+        return tool_entry.get("tool_use_id") or id(tool_entry)
 
     def _ensure_tool_placeholder(self, tool_entry: Dict[str, Any]) -> Optional[Any]:
-        key = tool_entry.get("tool_use_id") or id(tool_entry)
+        key = self._entry_key(tool_entry)
         placeholders = self.ui_state.tools.placeholders
         placeholder = placeholders.get(key)
         if placeholder:
@@ -9,51 +9,95 @@ from typing import Any, Tuple
 import streamlit as st
 
 THINKING_PATTERN = re.compile(r"<thinking>(.*?)</thinking>", re.DOTALL)
+_OPEN_TAG = "<thinking>"
+_CLOSE_TAG = "</thinking>"
+
+# Serialized JSON shorter than this is shown as a code block, not a tree
+_JSON_CODE_MAX_LENGTH = 2048
 
 
 def parse_model_response(raw_text: str | None) -> Tuple[str, str | None]:
     """Return displayable text and optional chain-of-thought content."""
     if not raw_text:
         return "", None
-    match = THINKING_PATTERN.search(raw_text)
-    chain_of_thought = match.group(1).strip() if match else None
-    cleaned = THINKING_PATTERN.sub("", raw_text).strip()
-    return cleaned, chain_of_thought
+    if _OPEN_TAG not in raw_text:
+        return raw_text.strip(), None
+
+    # One pass with str.find: keep the text between blocks and the first
+    # block's content; an unterminated opening tag is left in place
+    pieces = []
+    chain_of_thought = None
+    position = 0
+    start = raw_text.find(_OPEN_TAG)
+    while start != -1:
+        end = raw_text.find(_CLOSE_TAG, start + len(_OPEN_TAG))
+        if end == -1:
+            break
+        pieces.append(raw_text[position:start])
+        if chain_of_thought is None:
+            chain_of_thought = raw_text[start + len(_OPEN_TAG):end].strip()
+        position = end + len(_CLOSE_TAG)
+        start = raw_text.find(_OPEN_TAG, position)
+    pieces.append(raw_text[position:])
+    return "".join(pieces).strip(), chain_of_thought
 
 
 def strip_partial_thinking(raw_text: str) -> str:
     """Hide incomplete thinking tags during streaming."""
-    if "<thinking>" in raw_text and "</thinking>" not in raw_text:
-        return raw_text.split("<thinking>")[0]
-    if "<thinking>" in raw_text and "</thinking>" in raw_text:
-        cleaned, _ = parse_model_response(raw_text)
-        return cleaned
-    return raw_text
+    start = raw_text.find("<thinking>")
+    if start == -1:
+        return raw_text
+    if raw_text.find("</thinking>", start + len("<thinking>")) == -1:
+        return raw_text[:start]
+    cleaned, _ = parse_model_response(raw_text)
+    return cleaned
 
 
 def normalize_tool_value(value: Any) -> Tuple[Any, bool]:
     """Normalize tool payloads into a display value and a JSON flag."""
     if value is None:
         return None, False
-    if isinstance(value, (dict, list)):
-        return value, True
+    # Streamed tool input arrives as text, so test for strings first
     if isinstance(value, str):
-        candidate = value.strip()
-        if candidate.startswith("{") or candidate.startswith("["):
-            try:
-                return json.loads(value), True
-            except json.JSONDecodeError:
-                pass
+        first = value[:1]
+        if first.isspace():
+            # Only copy the payload when it actually has leading whitespace
+            first = value.lstrip()[:1]
+        if (first == "{" or first == "[") and len(value) > 1:
+            # Parsed fresh on each call: callers store the value in tool
+            # entries, so it must not be shared between equal payloads
+            return _parse_json(value)
         return value, False
+    if isinstance(value, (dict, list)):
+        return value, True
     return value, False
 
 
+def _parse_json(value: str) -> Tuple[Any, bool]:
+    try:
+        return json.loads(value), True
+    except json.JSONDecodeError:
+        return value, False
+
+
 def render_tool_value(value: Any, as_json: bool) -> None:
     """Render a tool payload using an appropriate Streamlit widget."""
     if value is None:
         return
     if as_json:
-        st.json(value)
+        try:
+            text = json.dumps(value, indent=2, ensure_ascii=False)
+        except (TypeError, ValueError):
+            text = None
+        if text is None:
+            # st.json copes with values json.dumps rejects
+            st.json(value)
+        elif len(text) < _JSON_CODE_MAX_LENGTH:
+            # Small payloads render as plain markdown instead of the JSON component
+            st.code(text, language="json")
+        else:
+            # st.json sends a string body as-is, so the payload is dumped once
+            st.json(text)
     elif isinstance(value, str):
         st.code(value)
     else:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, Tuple
 
 import streamlit as st
 
@@ -48,10 +48,20 @@ class StreamlitUIHandler(EventHandler):
         self.message_manager = MessageUIManager(ui_state, self.cot_manager)
         self._managers = (
             self.reasoning_manager,
-            self.cot_manager,
             self.tool_manager,
             self.message_manager,
         )
+        # Managers for each non-data primary key, in _managers order; every
+        # manager handles all the keys it knows in one call
+        reasoning, tool, message = self._managers
+        self._dispatch: Dict[str, Tuple[Any, ...]] = {
+            "reasoningText": (reasoning,),
+            "event": (reasoning, tool),
+            "current_tool_use": (tool,),
+            "tool_result": (tool,),
+            "result": (message,),
+            "force_stop": (tool, message),
+        }
 
     def reset_for_new_conversation(self) -> None:
         """Reset all managers for a new conversation."""
@@ -65,39 +75,52 @@ class StreamlitUIHandler(EventHandler):
         self.ui_state.chain_placeholder = chain_placeholder
         self.ui_state.response_placeholder = response_placeholder
 
-    @property
-    def priority(self) -> int:
-        return 10
+    priority: ClassVar[int] = 10
+
+    # Non-data keys in priority order; the first one present picks the managers
+    _PRIMARY_KEYS: ClassVar[Tuple[str, ...]] = (
+        "reasoningText",
+        "current_tool_use",
+        "tool_result",
+        "result",
+        "force_stop",
+        "event",
+    )
+
+    _EVENTS: ClassVar[FrozenSet[str]] = frozenset({
+        "reasoningText",
+        "current_tool_use",
+        "tool_result",
+        "data",
+        "result",
+        "force_stop",
+        "event",
+    })
 
     def can_handle(self, event_type: str) -> bool:
-        ui_events = {
-            "reasoningText",
-            "current_tool_use",
-            "tool_result",
-            "data",
-            "result",
-            "force_stop",
-            "event",
-        }
-        return event_type in ui_events
+        return event_type in self._EVENTS
 
     # ------------------------------------------------------------------
     def handle(self, event: Dict[str, Any]) -> None:
-        # Handle data events: COT manager first (to track state), then message manager
+        # Handle data events: the message manager runs them through the COT filter
         if "data" in event:
-            self.cot_manager.handle(event)
             self.message_manager.handle(event)
-
-        # Handle other events
-        for manager in self._managers:
-            if manager.can_handle(event) and "data" not in event:
-                manager.handle(event)
+        else:
+            for key in self._PRIMARY_KEYS:
+                if key in event:
+                    for manager in self._dispatch[key]:
+                        manager.handle(event)
+                    break
 
         if event.get("force_stop"):
             self.reasoning_manager.mark_force_stop()
             self.cot_manager.mark_force_stop()
             self.tool_manager.mark_force_stop()
 
+    def flush_response(self, force: bool = False) -> None:
+        """Render streamed text held back by the throttle."""
+        self.message_manager.flush(force)
+
     # ------------------------------------------------------------------
     def finalize_response(self) -> Dict[str, Any]:
         result = self.message_manager.finalize()
@@ -111,14 +134,16 @@ class StreamlitUIHandler(EventHandler):
 
         self.tool_manager.finalize()
 
-        # Clear the streaming response placeholder to avoid duplicate display
-        if self.ui_state.response_placeholder:
-            self.ui_state.response_placeholder.empty()
-
+        # Plain text reuses the response placeholder; tool calls and chain of
+        # thought need a fresh container to render several elements into
         render_parent = final_container
-        if render_parent is None and self.ui_state.message_container:
+        if render_parent is None and (tool_calls or chain_of_thought) and self.ui_state.message_container:
             render_parent = self.ui_state.message_container.empty()
 
+        # Clear the streaming response placeholder to avoid duplicate display
+        if render_parent is not None and self.ui_state.response_placeholder:
+            self.ui_state.response_placeholder.empty()
+
         if render_parent is not None:
             with render_parent:
                 if tool_calls:
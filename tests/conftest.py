@@ -0,0 +1,104 @@
+"""Shared pytest configuration for the test suite."""
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Make the top-level packages (agents, handlers, app) importable once
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class MockPlaceholder:
+    """Simple mock that mimics Streamlit placeholders."""
+
+    def __init__(self, name):
+        self.name = name
+        self.content = ""
+        # Tests only inspect the latest renders, so keep a bounded window
+        self.markdown_calls = deque(maxlen=64)
+        self.empty_calls = 0
+
+    def markdown(self, content):
+        self.content = content
+        self.markdown_calls.append(content)
+
+    def empty(self):
+        self.empty_calls += 1
+        self.content = ""
+
+    def container(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class MockExpander:
+    """Mock replacement for st.expander supporting empty() calls."""
+
+    def __init__(self, name):
+        self.name = name
+        self.children = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def empty(self):
+        placeholder = MockPlaceholder(f"{self.name}-child-{len(self.children)}")
+        self.children.append(placeholder)
+        return placeholder
+
+
+def _make_expander(label, *args, **kwargs):
+    return MockExpander(label)
+
+
+def _make_status(label, *args, **kwargs):
+    # MagicMock supports ``with status:`` like the real st.status container
+    status = MagicMock()
+    status.label = label
+    return status
+
+
+def _make_empty(*args, **kwargs):
+    return MockPlaceholder("empty")
+
+
+@pytest.fixture(scope="module")
+def streamlit_mock():
+    """Streamlit stand-in shared by the handler tests; built once per module.
+
+    Only the functions the UI modules call are provided, as plain attributes,
+    so lookups skip Mock's dynamic child creation.
+    """
+    return SimpleNamespace(
+        expander=Mock(side_effect=_make_expander),
+        status=Mock(side_effect=_make_status),
+        empty=Mock(side_effect=_make_empty),
+        json=Mock(),
+        code=Mock(),
+        write=Mock(),
+        markdown=Mock(),
+    )
+
+
+@pytest.fixture
+def placeholders():
+    """Fresh response/tool/status/chain placeholders for a single test."""
+    return SimpleNamespace(
+        response=MockPlaceholder("response"),
+        tool=MockPlaceholder("tool"),
+        status=MockPlaceholder("status"),
+        chain=MockPlaceholder("chain"),
+    )
@@ -0,0 +1,64 @@
+"""Tests for the calculator tool's restricted arithmetic evaluator."""
+import pytest
+
+pytest.importorskip("strands")
+
+from agents.strands_agent import _evaluate, _parse_expression, calculator
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("1 + 2 * 3", "7"),
+        ("(1 + 2) * 3", "9"),
+        ("7 / 2", "3.5"),
+        ("7 // 2", "3"),
+        ("7 % 3", "1"),
+        ("2 ** 10", "1024"),
+        ("-3", "-3"),
+        ("-(2 + 3) * 2", "-10"),
+        ("+4 - -1", "5"),
+        ("1e3 * 2", "2000.0"),
+        ("2.5E-1 * 4", "1.0"),
+        ("1_000 + 1", "1001"),
+    ],
+)
+def test_calculator_arithmetic(expression, expected):
+    assert calculator(expression) == expected
+
+
+@pytest.mark.parametrize("expression", ["1 / 0", "1 // 0", "1 % 0"])
+def test_calculator_division_by_zero(expression):
+    assert calculator(expression).startswith("Error: ")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["x + 1", "abs(-1)", "__import__('os')", "(1).real", "[1, 2]", "e", "E + 1"],
+)
+def test_calculator_rejects_non_arithmetic_input(expression):
+    assert calculator(expression) == "Error: Invalid expression"
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["x + 1", "abs(-1)", "(1).real", "1 if 1 else 2", "1 < 2"],
+)
+def test_evaluate_rejects_non_arithmetic_nodes(expression):
+    # Names, calls and attributes must be refused by the AST walk itself,
+    # independently of the character allowlist in front of it
+    with pytest.raises(ValueError, match="Invalid expression"):
+        _evaluate(_parse_expression(expression))
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("2 ** 1001", "Error: Exponent too large"),
+        ("9 ** 9 ** 9", "Error: Exponent too large"),
+        ("(2 ** 1000) ** 1000", "Error: Result too large"),
+        ("((10 ** 100) ** 100) ** 100", "Error: Result too large"),
+    ],
+)
+def test_calculator_refuses_oversized_powers(expression, message):
+    assert calculator(expression) == message
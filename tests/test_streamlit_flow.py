@@ -1,81 +1,73 @@
 """Automated tests for the Streamlit event flow."""
-from pathlib import Path
-import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict
 
 import pytest
-from unittest.mock import Mock
-
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
 pytest.importorskip("strands")
 
-from agents.bedrock_agent import BedrockAgent
+from agents.strands_agent import StrandsAgent
+from handlers.event_handlers import EventRegistry
 from handlers import ui_handlers as ui_handlers_module
 from handlers.ui_handlers import StreamlitUIHandler, StreamlitUIState
 from handlers.ui import messages as messages_module
+from handlers.ui.cot import COTUIManager
 from handlers.ui import placeholders as placeholders_module
 from handlers.ui import reasoning as reasoning_module
 from handlers.ui import tools as tools_module
 from handlers.ui import utils as utils_module
 
+# UI modules whose ``st`` global the handler tests replace with a mock
+MODULES_TO_PATCH = (
+    ui_handlers_module,
+    reasoning_module,
+    tools_module,
+    messages_module,
+    utils_module,
+    placeholders_module,
+)
 
-class MockPlaceholder:
-    """Simple mock that mimics Streamlit placeholders."""
-
-    def __init__(self, name):
-        self.name = name
-        self.content = ""
-        self.markdown_calls = []
-        self.empty_calls = 0
 
-    def markdown(self, content):
-        self.content = content
-        self.markdown_calls.append(content)
+@dataclass(slots=True)
+class FakeToolMetrics:
+    """Stand-in for a per-tool entry in AgentResult.metrics.tool_metrics."""
 
-    def empty(self):
-        self.empty_calls += 1
-        self.content = ""
+    tool: Dict[str, Any]
 
-    def container(self):
-        return self
 
-    def __enter__(self):
-        return self
+@dataclass(slots=True)
+class FakeMetrics:
+    """Stand-in for AgentResult.metrics."""
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        return False
+    tool_metrics: Dict[str, FakeToolMetrics]
 
 
-class MockExpander:
-    """Mock replacement for st.expander supporting empty() calls."""
+@dataclass(slots=True)
+class FakeResult:
+    """Stand-in for the AgentResult carried by a ``result`` event."""
 
-    def __init__(self, name):
-        self.name = name
-        self.children = []
+    metrics: FakeMetrics
+    message: Dict[str, Any]
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        return False
+def _replay(handler, events):
+    """Handle a batch of events, then render the pending text once."""
+    for event in events:
+        handler.handle(event)
+    handler.flush_response(force=True)
 
-    def empty(self):
-        placeholder = MockPlaceholder(f"{self.name}-child-{len(self.children)}")
-        self.children.append(placeholder)
-        return placeholder
 
 class TestStreamlitUIState:
     """Tests that validate StreamlitUIState behaviour."""
     
-    def test_placeholder_persistence_after_reset(self):
+    def test_placeholder_persistence_after_reset(self, placeholders):
         """reset() should keep placeholder references intact."""
         ui_state = StreamlitUIState()
         
         # Provide placeholder references
-        response_placeholder = MockPlaceholder("response")
-        tool_placeholder = MockPlaceholder("tool")
+        response_placeholder = placeholders.response
+        tool_placeholder = placeholders.tool
         ui_state.response_placeholder = response_placeholder
         ui_state.tool_placeholder = tool_placeholder
         
@@ -96,16 +88,25 @@ class TestStreamlitUIState:
 class TestStreamlitUIHandler:
     """Tests around StreamlitUIHandler behaviour."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _handler(self, streamlit_mock, placeholders, monkeypatch):
         """Construct a handler with mock placeholders."""
+        # Route every UI module through the shared Streamlit mock; monkeypatch
+        # restores the real module after each test
+        for function in vars(streamlit_mock).values():
+            function.reset_mock()
+        for module in MODULES_TO_PATCH:
+            monkeypatch.setattr(module, "st", streamlit_mock)
+        self.streamlit_mock = streamlit_mock
+
         self.ui_state = StreamlitUIState()
         self.handler = StreamlitUIHandler(self.ui_state)
         
-        # Construct mock placeholders
-        self.response_placeholder = MockPlaceholder("response")
-        self.tool_placeholder = MockPlaceholder("tool")
-        self.status_placeholder = MockPlaceholder("status")
-        self.chain_placeholder = MockPlaceholder("chain")
+        # Attach fresh mock placeholders
+        self.response_placeholder = placeholders.response
+        self.tool_placeholder = placeholders.tool
+        self.status_placeholder = placeholders.status
+        self.chain_placeholder = placeholders.chain
         
         self.handler.set_placeholders(
             self.status_placeholder,
@@ -113,44 +114,19 @@ class TestStreamlitUIHandler:
             self.chain_placeholder,
             self.response_placeholder
         )
-        # Provide a shared Streamlit mock for all UI modules
-        streamlit_mock = Mock()
-
-        def _make_expander(label, *args, **kwargs):
-            return MockExpander(label)
-
-        def _make_status(label, *args, **kwargs):
-            status = Mock()
-            status.update = Mock()
-            status.label = label
-            return status
-
-        streamlit_mock.expander.side_effect = _make_expander
-        streamlit_mock.status.side_effect = _make_status
-        streamlit_mock.empty.side_effect = lambda *a, **k: MockPlaceholder("empty")
-        streamlit_mock.json = Mock()
-        streamlit_mock.code = Mock()
-        streamlit_mock.write = Mock()
-        streamlit_mock.markdown = Mock()
-
-        ui_handlers_module.st = streamlit_mock
-        reasoning_module.st = streamlit_mock
-        tools_module.st = streamlit_mock
-        messages_module.st = streamlit_mock
-        utils_module.st = streamlit_mock
-        placeholders_module.st = streamlit_mock
-
-        self.streamlit_mock = streamlit_mock
     
-    def test_can_handle_ui_events(self):
+    @pytest.mark.parametrize("event_type,expected", [
+        ("data", True),
+        ("reasoningText", True),
+        ("current_tool_use", True),
+        ("tool_result", True),
+        ("result", True),
+        ("force_stop", True),
+        ("unknown_event", False),
+    ])
+    def test_can_handle_ui_events(self, event_type, expected):
         """The handler should accept relevant event types."""
-        assert self.handler.can_handle("data") == True
-        assert self.handler.can_handle("reasoningText") == True
-        assert self.handler.can_handle("current_tool_use") == True
-        assert self.handler.can_handle("tool_result") == True
-        assert self.handler.can_handle("result") == True
-        assert self.handler.can_handle("force_stop") == True
-        assert self.handler.can_handle("unknown_event") == False
+        assert self.handler.can_handle(event_type) is expected
     
     def test_handle_data_event(self):
         """Streaming data should update the response placeholder."""
@@ -219,25 +195,13 @@ class TestStreamlitUIHandler:
         
         # Handler should return None (meaning handled internally)
         assert result is None
-        # No state update occurs without a placeholder
-        assert "Test data" not in self.ui_state.message.raw_response
+        # Text is still recorded for finalization, but nothing is rendered
+        assert self.ui_state.message.raw_response == "Test data"
+        assert self.response_placeholder.markdown_calls == deque()
 
     def test_metrics_backfills_input_when_tool_result_missing(self):
         """Agent metrics should backfill tool input when the result event lacks it."""
 
-        class FakeToolMetrics:
-            def __init__(self, tool):
-                self.tool = tool
-
-        class FakeMetrics:
-            def __init__(self, tool_metrics):
-                self.tool_metrics = tool_metrics
-
-        class FakeResult:
-            def __init__(self, metrics):
-                self.metrics = metrics
-                self.message = {"content": []}
-
         # Register tool invocation without input information
         self.handler.handle({
             "current_tool_use": {
@@ -251,8 +215,8 @@ class TestStreamlitUIHandler:
             "name": "calculator",
             "input": {"expression": "2+2"},
         }
-        metrics = FakeMetrics({"calculator": FakeToolMetrics(tool_info)})
-        fake_result = FakeResult(metrics)
+        metrics = FakeMetrics(tool_metrics={"calculator": FakeToolMetrics(tool=tool_info)})
+        fake_result = FakeResult(metrics=metrics, message={"content": []})
 
         self.handler.handle({"result": fake_result})
 
@@ -263,65 +227,76 @@ class TestStreamlitUIHandler:
     def test_finalize_updates_progress_blocks(self):
         """Finalization should complete status blocks and render content."""
 
-        # Simulate streaming events
-        self.handler.handle({"reasoningText": "Reasoning chunk"})
-        self.handler.handle({"current_tool_use": {"toolUseId": "tool-3", "name": "calculator"}})
-        self.handler.handle({"tool_result": {"toolUseId": "tool-3", "output": "4"}})
-        self.handler.handle({"data": "Final answer"})
+        # Simulate streaming events as one batch
+        _replay(self.handler, [
+            {"reasoningText": "Reasoning chunk"},
+            {"current_tool_use": {"toolUseId": "tool-3", "name": "calculator"}},
+            {"tool_result": {"toolUseId": "tool-3", "output": "4"}},
+            {"data": "Final answer"},
+        ])
 
         tool_info = {"toolUseId": "tool-3", "name": "calculator", "input": {"expression": "2+2"}}
-        metrics = type("FakeMetrics", (), {"tool_metrics": {"calculator": type("FakeToolMetrics", (), {"tool": tool_info})()}})()
-        fake_result = type("FakeResult", (), {"metrics": metrics, "message": {"content": [{"text": "Final answer"}]}})()
+        metrics = FakeMetrics(tool_metrics={"calculator": FakeToolMetrics(tool=tool_info)})
+        fake_result = FakeResult(metrics=metrics, message={"content": [{"text": "Final answer"}]})
 
         self.handler.handle({"result": fake_result})
         self.handler.finalize_response()
 
         assert self.ui_state.reasoning.status is not None
         self.ui_state.reasoning.status.update.assert_called_with(
-            label="✅ Reasoning Complete",
+            label="🧠 Reasoning",
             state="complete",
             expanded=False,
         )
 
-        expander_labels = [call.args[0] for call in self.streamlit_mock.expander.call_args_list]
-        assert "🔧 Tool Usage: calculator ⏳" in expander_labels
-        assert expander_labels[-1] == "✅ Tool Usage: calculator"
-
-        running_status_call = None
-        for call in self.streamlit_mock.status.call_args_list:
-            if call.kwargs.get("state") == "running":
-                running_status_call = call
-                break
-        assert running_status_call is not None
+        # Tools stream as a running status and are redrawn complete at the end
+        status_calls = [
+            (call.args[0], call.kwargs.get("state"))
+            for call in self.streamlit_mock.status.call_args_list
+        ]
+        assert ("🔧 Tool: calculator...", "running") in status_calls
+        assert status_calls[-1] == ("✅ Tool: calculator", "complete")
         assert self.ui_state.tools.placeholders == {}
 
         assert self.response_placeholder.markdown_calls[-1] == "Final answer"
 
 
-class TestBedrockAgentIntegration:
-    """Integration-style tests around BedrockAgent."""
+@pytest.fixture(scope="module")
+def strands_agent():
+    """Construct the agent (and register its handlers) once per module."""
+    return StrandsAgent()
+
+
+@pytest.fixture(scope="module")
+def ui_handler(strands_agent):
+    """The agent's registered StreamlitUIHandler, looked up once."""
+    return strands_agent.event_registry.get_handler(StreamlitUIHandler)
+
+
+@pytest.mark.serial
+class TestStrandsAgentIntegration:
+    """Integration-style tests around StrandsAgent."""
     
-    def setup_method(self):
-        """Instantiate the agent for each test."""
-        self.agent = BedrockAgent()
+    @pytest.fixture(autouse=True)
+    def _agent(self, strands_agent):
+        """Reuse the module's agent, starting each test from a clean stream."""
+        strands_agent.ui_state.reset()
+        self.agent = strands_agent
     
-    def test_ui_state_persistence(self):
+    def test_ui_state_persistence(self, ui_handler, placeholders):
         """The agent should reuse the same UI state instance."""
         # Keep the original reference ID
         initial_ui_state = self.agent.get_ui_state()
         initial_id = id(initial_ui_state)
         
         # Register placeholders on the handler
-        response_placeholder = MockPlaceholder("response")
-        for handler in self.agent.event_registry._handlers:
-            if hasattr(handler, 'set_placeholders'):
-                handler.set_placeholders(
-                    MockPlaceholder("status"),
-                    MockPlaceholder("tool"),
-                    MockPlaceholder("chain"),
-                    response_placeholder
-                )
-                break
+        response_placeholder = placeholders.response
+        ui_handler.set_placeholders(
+            placeholders.status,
+            placeholders.tool,
+            placeholders.chain,
+            response_placeholder
+        )
         
         # Simulate the reset step of the stream
         self.agent.ui_state.reset()
@@ -341,19 +316,16 @@ class TestBedrockAgentIntegration:
         assert "LoggingHandler" in handler_types
         assert "DebugHandler" in handler_types
     
-    def test_event_processing_flow(self):
+    def test_event_processing_flow(self, ui_handler, placeholders):
         """Processing a data event should update the UI state."""
         # Attach placeholders before processing
-        response_placeholder = MockPlaceholder("response")
-        for handler in self.agent.event_registry._handlers:
-            if hasattr(handler, 'set_placeholders'):
-                handler.set_placeholders(
-                    MockPlaceholder("status"),
-                    MockPlaceholder("tool"),
-                    MockPlaceholder("chain"),
-                    response_placeholder
-                )
-                break
+        response_placeholder = placeholders.response
+        ui_handler.set_placeholders(
+            placeholders.status,
+            placeholders.tool,
+            placeholders.chain,
+            response_placeholder
+        )
         
         # Process a synthetic streaming event
         test_event = {"data": "Test streaming text"}
@@ -365,56 +337,91 @@ class TestBedrockAgentIntegration:
         assert len(response_placeholder.markdown_calls) > 0
 
 
+class TestCOTUIManager:
+    """Tests for the incremental thinking-block filter."""
+
+    STREAM = "Before <thinking>plan</thinking>After"
+
+    @staticmethod
+    def _filter(chunks):
+        """Stream ``chunks`` through a fresh manager; return it and the visible text."""
+        manager = COTUIManager(StreamlitUIState())
+        visible = "".join(manager.filter_thinking_from_data(chunk) for chunk in chunks)
+        return manager, visible + manager.flush_pending()
+
+    def test_tags_split_at_every_offset(self):
+        """Tags cut across chunk boundaries anywhere are still recognised."""
+        stream = self.STREAM
+        for first in range(len(stream) + 1):
+            for second in range(first, len(stream) + 1):
+                chunks = [stream[:first], stream[first:second], stream[second:]]
+                manager, visible = self._filter(chunks)
+                assert visible == "Before After", chunks
+                assert manager.ui_state.cot.text == "plan", chunks
+
+    def test_flush_pending_releases_partial_tag(self):
+        """Text held back as a possible tag is released once the stream ends."""
+        manager = COTUIManager(StreamlitUIState())
+        assert manager.filter_thinking_from_data("Answer <think") == "Answer "
+        assert manager.flush_pending() == "<think"
+        assert manager.flush_pending() == ""
+
+    def test_flush_pending_drops_unclosed_block(self):
+        """An unterminated thinking block never leaks into the response."""
+        manager = COTUIManager(StreamlitUIState())
+        assert manager.filter_thinking_from_data("Answer <thinking>half a plan</think") == "Answer "
+        assert manager.flush_pending() == ""
+        assert manager.ui_state.cot.text == ""
+
+    def test_two_blocks_in_one_stream(self):
+        """Every thinking block is removed from the visible text."""
+        stream = "<thinking>first plan</thinking>Calling tool.<thinking>second plan</thinking>Answer."
+        _, visible = self._filter([stream])
+        assert visible == "Calling tool.Answer."
+
+        _, visible = self._filter(list(stream))
+        assert visible == "Calling tool.Answer."
+
+    def test_first_block_is_the_chain_of_thought(self):
+        """Streaming keeps the same block as parse_model_response: the first."""
+        stream = "<thinking>first plan</thinking>Calling tool.<thinking>second plan</thinking>Answer."
+        manager, _ = self._filter(list(stream))
+        assert manager.ui_state.cot.text == "first plan"
+        assert utils_module.parse_model_response(stream)[1] == "first plan"
+
+
+class TestToolValueNormalization:
+    """Tests for utils.normalize_tool_value."""
+
+    def test_equal_payloads_parse_to_independent_values(self):
+        """Each call returns its own object, so stored entries never alias."""
+        payload = '{"expression": "2+2", "steps": [1, 2]}'
+        first, first_is_json = utils_module.normalize_tool_value(payload)
+        second, second_is_json = utils_module.normalize_tool_value(payload)
+
+        assert first_is_json and second_is_json
+        assert first == second
+        first["steps"].append(3)
+        assert second == {"expression": "2+2", "steps": [1, 2]}
+
+
 class TestEventRegistry:
     """Tests for EventRegistry helpers."""
     
-    def test_event_type_extraction(self):
+    # Extraction is stateless, so one registry serves every case
+    registry = EventRegistry()
+
+    @pytest.mark.parametrize("event,expected", [
+        ({"data": "text", "other": "value"}, "data"),
+        ({"current_tool_use": {}, "event": {}}, "current_tool_use"),
+        ({"unknown": "value"}, "unknown"),
+    ])
+    def test_event_type_extraction(self, event, expected):
         """Event type extraction should respect the priority order."""
-        from handlers.event_handlers import EventRegistry
-        
-        registry = EventRegistry()
-        
-        # Validate extraction order
-        assert registry._extract_event_type({"data": "text", "other": "value"}) == "data"
-        assert registry._extract_event_type({"current_tool_use": {}, "event": {}}) == "current_tool_use"
-        assert registry._extract_event_type({"unknown": "value"}) == "unknown"
+        assert self.registry._extract_event_type(event) == expected
 
 
 if __name__ == "__main__":
-    # Execute a lightweight manual test run
     import sys
-    
-    def run_tests():
-        """Execute the test methods without pytest."""
-        test_classes = [
-            TestStreamlitUIState,
-            TestStreamlitUIHandler, 
-            TestBedrockAgentIntegration,
-            TestEventRegistry
-        ]
-        
-        total_tests = 0
-        passed_tests = 0
-        
-        for test_class in test_classes:
-            instance = test_class()
-
-            # Run setup_method if the class defines one
-            if hasattr(instance, 'setup_method'):
-                instance.setup_method()
-
-            # Execute every test_* method
-            for method_name in dir(instance):
-                if method_name.startswith('test_'):
-                    total_tests += 1
-                    try:
-                        method = getattr(instance, method_name)
-                        method()
-                        passed_tests += 1
-                    except Exception as e:
-                        pass
-
-        return passed_tests == total_tests
-    
-    success = run_tests()
-    sys.exit(0 if success else 1)
+
+    sys.exit(pytest.main([__file__, "-x", "--tb=short"]))